@@ -7,6 +7,7 @@ import logging
 import os
 import platform
 import signal
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List
 
@@ -80,6 +81,9 @@ async def mock_pypi_version():
 # 静态文件从 cache/http/ 提取后放在工具根目录的 static/ 下
 _tool_root = Path(__file__).parent.parent  # uiautodev/ -> tools/uiautodev/
 _static_dir = _tool_root / "static"
+# 路径在启动时计算一次，避免每个请求重复构建 Path 对象
+_index_html = str(_static_dir / "index.html")
+_favicon = str(_static_dir / "favicon.ico")
 
 if _static_dir.exists():
     # 挂载 assets 目录（JS、CSS、字体、图片等）
@@ -95,12 +99,12 @@ if _static_dir.exists():
         单页应用路由：所有 HTML 页面都返回 index.html
         前端路由（Vue Router）会处理 URL 路径
         """
-        return FileResponse(_static_dir / "index.html")
+        return FileResponse(_index_html)
 
     @app.get("/favicon.ico")
     async def serve_favicon():
         """提供网站图标"""
-        return FileResponse(_static_dir / "favicon.ico")
+        return FileResponse(_favicon)
 
     logger.info(f"✅ 静态文件服务已启用: {_static_dir}")
 else:
@@ -146,9 +150,9 @@ class InfoResponse(BaseModel):
     drivers: List[str]
 
 
-@app.get("/api/info")
-def info() -> InfoResponse:
-    """Information about the application"""
+@lru_cache(maxsize=1)
+def _static_info() -> InfoResponse:
+    # 进程生命周期内不变，只构建一次（启动脚本会轮询 /api/info 检测就绪）
     return InfoResponse(
         version=__version__,
         description="client for https://uiauto.dev",
@@ -159,6 +163,12 @@ def info() -> InfoResponse:
     )
 
 
+@app.get("/api/info")
+def info() -> InfoResponse:
+    """Information about the application"""
+    return _static_info()
+
+
 @app.post("/api/ocr_image")
 async def _ocr_image(file: UploadFile = File(...)) -> List[Node]:
     """OCR an image"""
@@ -184,13 +184,18 @@ def shutdown(port: int):
 
 
 def open_browser_when_server_start(local_server_url: str, offline: bool = False):
-    deadline = time.time() + 10
-    while time.time() < deadline:
-        try:
-            httpx.get(f"{local_server_url}/api/info", timeout=1)
-            break
-        except Exception as e:
-            time.sleep(0.5)
+    deadline = time.monotonic() + 10
+    backoff = 0.05
+    # 复用同一个连接池，避免每次探测都新建 client
+    with httpx.Client(base_url=local_server_url, timeout=1) as client:
+        while time.monotonic() < deadline:
+            try:
+                client.get("/api/info")
+                break
+            except httpx.HTTPError:
+                # 服务通常在几百毫秒内就绪，从 50ms 开始指数退避，上限 0.5s
+                time.sleep(backoff)
+                backoff = min(backoff * 1.5, 0.5)
     import webbrowser
     web_url = get_webpage_url(local_server_url if offline else None)
     logger.info("open browser: %s", web_url)
@@ -21,22 +21,28 @@ from uiautodev.model import AppInfo, Node
 from uiautodev.utils.common import node_travel
 
 COMMANDS: Dict[Command, Callable] = {}
+# get_type_hints 需要解析字符串注解，开销较大，按命令缓存结果
+_PARAMS_TYPES: Dict[Command, Optional[BaseModel]] = {}
 
 
 def register(command: Command):
     def wrapper(func):
         COMMANDS[command] = func
+        _PARAMS_TYPES.pop(command, None)
         return func
 
     return wrapper
 
 
 def get_command_params_type(command: Command) -> Optional[BaseModel]:
+    if command in _PARAMS_TYPES:
+        return _PARAMS_TYPES[command]
     func = COMMANDS.get(command)
     if func is None:
         return None
     type_hints = typing.get_type_hints(func)
-    return type_hints.get("params")
+    params_type = _PARAMS_TYPES[command] = type_hints.get("params")
+    return params_type
 
 
 def send_command(driver: BaseDriver, command: Command, params=None):
@@ -175,8 +181,8 @@ def find_elements(driver: BaseDriver, params: FindElementRequest) -> FindElement
 @register(Command.CLICK_ELEMENT)
 def click_element(driver: BaseDriver, params: FindElementRequest):
     node = None
-    deadline = time.time() + params.timeout
-    while time.time() < deadline:
+    deadline = time.monotonic() + params.timeout
+    while time.monotonic() < deadline:
         result = find_elements(driver, params)
         if result.value:
             node = result.value[0]
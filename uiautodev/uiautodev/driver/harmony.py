@@ -285,9 +285,9 @@ class HarmonyDriver(BaseDriver):
             if (module_name := item["moduleName"]) and module_name == item["mainModule"]:
                 score += 1
             item["score"] = score
-        abilities.sort(key=lambda x: (not x["isLauncherAbility"], -x["score"]))
-        logger.debug(f"main ability: {abilities[0]}")
-        return abilities[0]
+        main_ability = min(abilities, key=lambda x: (not x["isLauncherAbility"], -x["score"]))
+        logger.debug(f"main ability: {main_ability}")
+        return main_ability
 
     def app_launch(self, package: str, page_name: Optional[str] = None):
         """
@@ -229,8 +229,8 @@ class UDT:
             logger.debug("forward tcp:6790 -> tcp:%d", self._lport)
 
     def _wait_ready(self):
-        deadline = time.time() + 10
-        while time.time() < deadline:
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
             try:
                 self._dev_request("GET", "/status", timeout=1)
                 return
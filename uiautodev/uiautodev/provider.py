@@ -81,10 +81,38 @@ class HarmonyProvider(BaseProvider):
     def __init__(self):
         super().__init__()
         self.hdc = HDC()
+        # model/name 为设备常量，每次 hdc shell 都要起子进程，按 serial 缓存
+        self._device_meta: dict[str, tuple[str, str]] = {}
+
+    @staticmethod
+    def _is_valid_param(value: str) -> bool:
+        # hdc shell 不检查退出码，失败时 stdout 为错误信息（可能多行）
+        # 只缓存形如单行纯文本的值，其余情况下次轮询重新查询
+        if not value or "\n" in value or not value.isprintable():
+            return False
+        return not value.startswith("[Fail]") and "fail!" not in value
+
+    def _get_device_meta(self, serial: str) -> tuple[str, str]:
+        meta = self._device_meta.get(serial)
+        if meta is None:
+            meta = (self.hdc.get_model(serial), self.hdc.get_name(serial))
+            if all(self._is_valid_param(v) for v in meta):
+                self._device_meta[serial] = meta
+        return meta
 
     def list_devices(self) -> list[DeviceInfo]:
         devices = self.hdc.list_device()
-        return [DeviceInfo(serial=d, model=self.hdc.get_model(d), name=self.hdc.get_name(d)) for d in devices]
+        # 断开的设备不保留缓存，无线 ip:port 可能被其他设备复用
+        # /list 为同步接口，会在线程池中并发执行，这里用 pop 容忍重复删除
+        alive = set(devices)
+        for serial in list(self._device_meta):
+            if serial not in alive:
+                self._device_meta.pop(serial, None)
+        ret: list[DeviceInfo] = []
+        for d in devices:
+            model, name = self._get_device_meta(d)
+            ret.append(DeviceInfo(serial=d, model=model, name=name))
+        return ret
 
     @lru_cache
     def get_device_driver(self, serial: str) -> HarmonyDriver:
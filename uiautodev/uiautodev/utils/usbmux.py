@@ -274,10 +274,10 @@ class BinaryMuxConnection(MuxConnection):
     def get_device_list(self, timeout: float = None):
         """ use timeout to wait for the device list to be fully populated """
         self._assert_not_connected()
-        end = time.time() + timeout
+        end = time.monotonic() + timeout
         self.listen()
-        while time.time() < end:
-            self._sock.settimeout(end - time.time())
+        while time.monotonic() < end:
+            self._sock.settimeout(max(0, end - time.monotonic()))
             try:
                 self._receive_device_state_update()
             except (BlockingIOError, StreamError):